@@ -35,7 +35,30 @@ import math
 import os
 import re
 import sys
-from typing import Dict, List, Tuple, Optional
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from typing import Dict, List, NamedTuple, Tuple, Optional
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # pyarrow is optional; we fall back to the stdlib csv reader
+    pa = None
+    pacsv = None
+
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError:  # numpy/pandas are optional; we fall back to per-cell parsing
+    np = None
+    pd = None
+
+try:
+    import numba
+    from numba import prange
+except ImportError:  # numba is optional; the kernel below runs as plain Python
+    numba = None
+    prange = range
 
 # ---------- Helpers for parsing & units ----------
 
@@ -53,7 +76,7 @@ CANDIDATE_METRICS = [
 ]
 
 # Environment / non-identity columns to ignore when auto-picking keys
-NON_ID_COLS = set([
+NON_ID_COLS = frozenset([
     # stats/metrics (case-insensitive match)
     "mean","median","p95","min","max","q1","q3","stddev","error","op/s","operationspersecond","allocated",
     "alloc b/op","allocated/op","gen 0","gen 1","gen 2",
@@ -71,13 +94,31 @@ NON_ID_COLS = set([
 TIME_UNITS = {"ns": 1.0, "us": 1_000.0, "µs": 1_000.0, "μs": 1_000.0, "ms": 1_000_000.0, "s": 1_000_000_000.0}
 MEM_UNITS = {"b": 1, "kb": 1024, "kB": 1024, "mb": 1024**2, "gb": 1024**3}
 
+# Canonical unit-token -> base-unit factor tables, shared by the scalar and
+# vectorized conversion paths.
+TIME_FACTORS = {"": 1.0, "ns": 1.0, "us": 1_000.0, "µs": 1_000.0, "μs": 1_000.0,
+                "ms": 1_000_000.0,
+                "s": 1_000_000_000.0, "sec": 1_000_000_000.0, "seconds": 1_000_000_000.0}
+MEM_FACTORS = {"": 1.0, "b": 1.0, "byte": 1.0, "bytes": 1.0,
+               "k": 1024.0, "kb": 1024.0, "kib": 1024.0,
+               "m": 1024.0**2, "mb": 1024.0**2, "mib": 1024.0**2,
+               "g": 1024.0**3, "gb": 1024.0**3, "gib": 1024.0**3}
+
+_WS_RE = re.compile(r"\s+")
+
 def norm(s: str) -> str:
-    return re.sub(r"\s+", " ", s.strip()).strip()
+    return _WS_RE.sub(" ", s.strip()).strip()
 
+@lru_cache(maxsize=4096)
 def normkey(s: str) -> str:
-    return re.sub(r"\s+", " ", s.strip()).lower()
+    # Called thousands of times on a tiny set of header strings; memoize.
+    return _WS_RE.sub(" ", s.strip()).lower()
 
 num_re = re.compile(r"[-+]?\d[\d,]*\.?\d*(?:[eE][-+]?\d+)?")
+_num_search = num_re.search
+_COMMA_DROP = str.maketrans("", "", ",")
+
+CANDIDATE_METRICS_NORM = frozenset(normkey(c) for c in CANDIDATE_METRICS)
 
 def parse_num(s: str) -> Optional[float]:
     """Extract first float from a string, ignoring commas and trailing text."""
@@ -88,10 +129,12 @@ def parse_num(s: str) -> Optional[float]:
     s = str(s).strip()
     if not s:
         return None
-    m = num_re.search(s)
+    m = _num_search(s)
     if not m:
         return None
-    token = m.group(0).replace(",", "")
+    token = m.group(0)
+    if "," in token:
+        token = token.translate(_COMMA_DROP)
     try:
         return float(token)
     except ValueError:
@@ -102,7 +145,7 @@ def unit_suffix(s: str) -> str:
     if s is None:
         return ""
     s = str(s).strip()
-    m = num_re.search(s)
+    m = _num_search(s)
     if not m:
         return ""
     suffix = s[m.end():].strip().lower()
@@ -111,34 +154,48 @@ def unit_suffix(s: str) -> str:
     suffix = suffix.replace("μs", "us").replace("µs", "us")
     return suffix
 
+def parse_num_and_suffix(s) -> Tuple[Optional[float], str]:
+    """parse_num + unit_suffix in one num_re pass over the cell."""
+    if s is None:
+        return None, ""
+    if isinstance(s, (int, float)):
+        return float(s), ""
+    s = str(s).strip()
+    if not s:
+        return None, ""
+    m = _num_search(s)
+    if not m:
+        return None, ""
+    token = m.group(0)
+    if "," in token:
+        token = token.translate(_COMMA_DROP)
+    try:
+        num = float(token)
+    except ValueError:
+        return None, ""
+    suffix = s[m.end():].strip().lower()
+    suffix = suffix.replace("per second", "/s").replace("per sec", "/s").replace(" per s", "/s")
+    suffix = suffix.replace("μs", "us").replace("µs", "us")
+    return num, suffix
+
 def to_base_time(val: float, unit: str) -> float:
-    """Convert any time to nanoseconds (ns)."""
-    for u, factor in TIME_UNITS.items():
-        if unit.startswith(u):
-            return val * factor
-    # No known unit; assume ns
-    return val
+    """Convert any time to nanoseconds (ns); unknown units are assumed ns.
 
-def to_base_mem(val: float, unit: str) -> float:
-    """Convert any mem to bytes."""
-    u = unit
-    if not u:
-        # often Allocated has no suffix and is already bytes/op
+    One dict lookup on the canonical leading token, instead of the old
+    startswith scan over TIME_UNITS ("s".startswith made any suffix
+    beginning with "s" parse as seconds).
+    """
+    if not unit:
         return val
-    u = u.replace("bytes", "b").replace("byte", "b")
-    u = u.replace("kb", "kb").replace("kib", "kb")
-    u = u.replace("mb", "mb").replace("mib", "mb")
-    u = u.replace("gb", "gb").replace("gib", "gb")
-    u = u.strip().lower()
-    if u in ("b",):
+    tok = unit.split()[0].split("/")[0]
+    return val * TIME_FACTORS.get(tok, 1.0)
+
+def to_base_mem(val: float, unit: str) -> float:
+    """Convert any mem to bytes; no suffix means the cell is already bytes/op."""
+    if not unit:
         return val
-    if u in ("kb", "kib", "k"):
-        return val * 1024.0
-    if u in ("mb", "mib", "m"):
-        return val * 1024.0**2
-    if u in ("gb", "gib", "g"):
-        return val * 1024.0**3
-    return val
+    tok = unit.strip().lower().split()[0].split("/")[0]
+    return val * MEM_FACTORS.get(tok, 1.0)
 
 def metric_kind(header_name: str) -> str:
     k = normkey(header_name)
@@ -155,13 +212,45 @@ def metric_kind(header_name: str) -> str:
         return "throughput"
     return "time"
 
+# Integer codes for the JIT kernel: numba wants numbers, not strings.
+KIND_CODES = {"time": 0, "memory": 1, "gc": 2, "throughput": 3}
+
+def _delta_kernel(old, new, kind_code, warn_time, warn_alloc, warn_throughput, deltas, regressed):
+    """Percent delta + regression flag over aligned base-unit arrays.
+
+    deltas[i] is NaN where old is 0/NaN (no meaningful delta). JIT-compiled
+    with numba when available; otherwise runs as-is in plain Python.
+    """
+    for i in prange(old.shape[0]):
+        ov = old[i]
+        if ov == 0.0 or ov != ov:
+            deltas[i] = math.nan
+            regressed[i] = False
+            continue
+        d = (new[i] - ov) / ov * 100.0
+        deltas[i] = d
+        if d != d:
+            regressed[i] = False
+        elif kind_code == 3:
+            regressed[i] = d < -warn_throughput
+        elif kind_code == 1:
+            regressed[i] = d > warn_alloc
+        else:
+            regressed[i] = d > warn_time
+
+if numba is not None:
+    _delta_kernel = numba.njit(cache=True, nogil=True, parallel=True)(_delta_kernel)
+
+def build_metric_kind_map(metrics: List[str]) -> Dict[str, str]:
+    """Classify each metric once; the row loop then does one dict lookup per use."""
+    return {m: metric_kind(m) for m in metrics}
+
 def convert_to_base(metric: str, raw_value: str) -> Optional[float]:
     """Convert raw cell (possibly with units) to base units for comparison."""
-    n = parse_num(raw_value)
+    n, suf = parse_num_and_suffix(raw_value)
     if n is None:
         return None
     k = metric_kind(metric)
-    suf = unit_suffix(raw_value)
     if k == "time":
         return to_base_time(n, suf)
     if k == "memory":
@@ -169,34 +258,60 @@ def convert_to_base(metric: str, raw_value: str) -> Optional[float]:
     # gc or throughput or unknown -> just the numeric
     return n
 
-def fmt_value(metric: str, base_val: Optional[float], time_unit: str, mem_unit: str) -> str:
-    if base_val is None or (isinstance(base_val, float) and math.isnan(base_val)):
-        return "-"
-    k = metric_kind(metric)
+# One pass over the whole column: number and unit captured by a single regex.
+col_num_re = re.compile(r"([-+]?\d[\d,]*\.?\d*(?:[eE][-+]?\d+)?)\s*([a-zA-Zµμ]*)")
+
+def convert_column_to_base(metric: str, values) -> "np.ndarray":
+    """Vectorized convert_to_base over a whole column.
+
+    Returns a float64 array in base units (ns / bytes / raw) with NaN for
+    cells that do not parse. Numeric and string columns both handled; the
+    per-cell regex cascade is replaced by one C-level extract + multiply.
+    """
+    kind = metric_kind(metric)
+    s = pd.Series(values)
+    if s.dtype.kind in "iuf":
+        # Already numeric (e.g. pyarrow-typed column): no unit suffix to strip.
+        return s.to_numpy(dtype="float64", copy=False)
+    ext = s.astype("string").str.extract(col_num_re)
+    nums = pd.to_numeric(ext[0].str.replace(",", "", regex=False), errors="coerce").to_numpy(dtype="float64")
+    if kind in ("time", "memory"):
+        units = ext[1].fillna("").str.lower().str.replace("μs", "us").str.replace("µs", "us")
+        factor_map = TIME_FACTORS if kind == "time" else MEM_FACTORS
+        factors = units.map(factor_map).fillna(1.0).to_numpy(dtype="float64")
+        return nums * factors
+    # gc / throughput / unknown -> just the numeric value
+    return nums
+
+def make_fmt_spec(metric: str, time_unit: str, mem_unit: str,
+                  kind: Optional[str] = None) -> Tuple[float, str, str]:
+    """(scale, suffix, kind) for displaying base-unit values of a metric.
+
+    These depend only on the metric and the chosen units, so compare builds
+    them once per run instead of re-dispatching on kind for every cell.
+    """
+    k = kind if kind is not None else metric_kind(metric)
     if k == "time":
-        # convert ns -> selected
-        factor = TIME_UNITS.get(time_unit, 1.0)
-        v = base_val / factor
-        return f"{v:.3f} {time_unit}"
+        return TIME_UNITS.get(time_unit, 1.0), time_unit, k
     if k == "memory":
         mu = mem_unit.lower()
-        denom = 1.0
-        if mu == "kb":
-            denom = 1024.0
-        elif mu == "mb":
-            denom = 1024.0**2
-        elif mu == "gb":
-            denom = 1024.0**3
-        v = base_val / denom
-        return f"{v:.3f} {mem_unit.upper()}"
-    # throughput or gc
+        denom = {"kb": 1024.0, "mb": 1024.0**2, "gb": 1024.0**3}.get(mu, 1.0)
+        return denom, mem_unit.upper(), k
     if k == "throughput":
-        return f"{base_val:.3f} ops/s"
-    return f"{base_val:.3f}"
+        return 1.0, "ops/s", k
+    return 1.0, "", k
+
+def fmt_value(metric: str, base_val: Optional[float], time_unit: str, mem_unit: str,
+              kind: Optional[str] = None) -> str:
+    if base_val is None or (isinstance(base_val, float) and math.isnan(base_val)):
+        return "-"
+    scale, suffix, _ = make_fmt_spec(metric, time_unit, mem_unit, kind)
+    v = base_val / scale
+    return f"{v:.3f} {suffix}" if suffix else f"{v:.3f}"
 
-def arrow(delta_pct: float, metric: str) -> str:
+def arrow(delta_pct: float, metric: str, kind: Optional[str] = None) -> str:
     """Return arrow indicating good/bad: ↓ good for time/mem/gc; ↑ good for throughput."""
-    k = metric_kind(metric)
+    k = kind if kind is not None else metric_kind(metric)
     if k in ("time", "memory", "gc"):
         return "↓" if delta_pct < 0 else ("↑" if delta_pct > 0 else "→")
     else:
@@ -210,12 +325,45 @@ def pct(delta: Optional[float]) -> str:
 
 # ---------- CSV loading & key building ----------
 
-def read_csv(path: str) -> Tuple[List[Dict[str, str]], List[str]]:
+def read_csv(path: str, legacy: bool = False) -> Tuple[Dict[str, list], List[str], int]:
+    """Load a CSV as columnar data: ({header: column values}, headers, row count).
+
+    Uses pyarrow's native CSV parser when available (single C-level pass,
+    columnar layout, no per-cell Python dict per row). The stdlib
+    csv.DictReader path is kept for --legacy-csv and for environments
+    without pyarrow; it produces the same column-oriented shape.
+    """
+    if pacsv is not None and not legacy:
+        # Read the header row first and force every column to string: letting
+        # pyarrow infer types breaks key identity across files (a param column
+        # that is all-numeric in one file but has a "?" cell in the other
+        # yields 100 vs "100" key tuples, so nothing matches) and changes key
+        # display vs the DictReader path. An empty file (no header) falls
+        # through to the stdlib reader and the normal error handling.
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            header = next(csv.reader(f), None)
+        if header:
+            convert = pacsv.ConvertOptions(column_types={h: pa.string() for h in header})
+            table = pacsv.read_csv(path, convert_options=convert)
+            headers = list(table.column_names)
+            cols = {c: table[c].to_numpy(zero_copy_only=False) for c in headers}
+            return cols, headers, table.num_rows
     with open(path, newline="", encoding="utf-8-sig") as f:
         rdr = csv.DictReader(f)
-        rows = [ {h: v for h, v in row.items()} for row in rdr ]
+        rows = [row for row in rdr]
         headers = rdr.fieldnames or []
-    return rows, headers
+    cols = {h: [r.get(h, "") for r in rows] for h in headers}
+    return cols, headers, len(rows)
+
+def cell(cols: Dict[str, list], col: str, i: int):
+    """Fetch one cell from columnar data, normalizing missing/null to ""."""
+    values = cols.get(col)
+    if values is None:
+        return ""
+    v = values[i]
+    if v is None or (isinstance(v, float) and math.isnan(v)):
+        return ""
+    return v
 
 def pick_key_columns(headers_a: List[str], headers_b: List[str], user_keys: Optional[List[str]] = None) -> List[str]:
     H1 = [h for h in headers_a]
@@ -253,15 +401,17 @@ def pick_key_columns(headers_a: List[str], headers_b: List[str], user_keys: Opti
             picked.append(s1[normkey(p)])
 
     # Add any obvious parameter columns (present in both and not a known metric)
+    picked_norm = {normkey(x) for x in picked}
     for h in H1:
         nk = normkey(h)
         if nk in NON_ID_COLS:
             continue
         # parameters are often custom names; include if present in both and look like a value (e.g., "N", "Size", "Payload")
-        if nk in s2 and nk not in [normkey(x) for x in picked]:
+        if nk in s2 and nk not in picked_norm:
             # Avoid adding numeric metric candidates by checking if the column is in candidate metrics
-            if nk not in [normkey(x) for x in CANDIDATE_METRICS]:
+            if nk not in CANDIDATE_METRICS_NORM:
                 picked.append(h)
+                picked_norm.add(nk)
 
     if not picked:
         # Fallback to Method if nothing else
@@ -273,31 +423,51 @@ def pick_key_columns(headers_a: List[str], headers_b: List[str], user_keys: Opti
             return shared
     return picked
 
-def build_key(row: Dict[str, str], key_cols: List[str]) -> str:
-    parts = []
+def key_to_display(key: tuple, key_cols: List[str]) -> str:
+    return " | ".join(f"{c}={v}" for c, v in zip(key_cols, key))
+
+def build_keys(cols: Dict[str, list], n: int, key_cols: List[str]) -> List[tuple]:
+    """Build all row keys column-wise: one null-normalization pass per key
+    column, then a single C-level zip, instead of per-row cell() calls."""
+    arrays = []
     for c in key_cols:
-        val = row.get(c, "")
-        parts.append(f"{c}={val}")
-    return " | ".join(parts)
+        values = cols.get(c)
+        if values is None:
+            arrays.append([""] * n)
+        else:
+            arrays.append(["" if v is None or (isinstance(v, float) and v != v) else v
+                           for v in values])
+    return list(zip(*arrays)) if arrays else [()] * n
+
+def align_keys(keys, old_map, new_map):
+    """Index arrays for the keys present in both files, in display order.
+
+    Returns (both_pos, old_idx, new_idx): both_pos maps key -> position in
+    the aligned arrays; old_idx/new_idx are the matching row positions in
+    the old/new column arrays, ready for vectorized gathers.
+    """
+    both_keys = [k for k in keys if k in old_map and k in new_map]
+    both_pos = {k: j for j, k in enumerate(both_keys)}
+    oidx = np.fromiter((old_map[k] for k in both_keys), dtype=np.int64, count=len(both_keys))
+    nidx = np.fromiter((new_map[k] for k in both_keys), dtype=np.int64, count=len(both_keys))
+    return both_pos, oidx, nidx
 
 def pick_metrics(headers_a: List[str], headers_b: List[str], requested: Optional[List[str]]) -> List[str]:
-    s1 = set([normkey(h) for h in headers_a])
-    s2 = set([normkey(h) for h in headers_b])
+    # Normalize each header list once; the loops below are lookups only.
+    norm_a = {}
+    for h in headers_a:
+        norm_a.setdefault(normkey(h), h)
+    norm_b = {}
+    for h in headers_b:
+        norm_b.setdefault(normkey(h), h)
 
     if requested:
         res = []
         for m in requested:
             nm = normkey(m)
             # find original header case from either file
-            orig = None
-            for h in headers_a:
-                if normkey(h) == nm:
-                    orig = h; break
-            if not orig:
-                for h in headers_b:
-                    if normkey(h) == nm:
-                        orig = h; break
-            if orig and nm in s1 and nm in s2:
+            orig = norm_a.get(nm) or norm_b.get(nm)
+            if orig and nm in norm_a and nm in norm_b:
                 res.append(orig)
         if res:
             return res
@@ -306,10 +476,9 @@ def pick_metrics(headers_a: List[str], headers_b: List[str], requested: Optional
     res = []
     for cand in CANDIDATE_METRICS:
         nc = normkey(cand)
-        for h in headers_a:
-            if normkey(h) == nc and nc in s2:
-                res.append(h)
-                break
+        h = norm_a.get(nc)
+        if h is not None and nc in norm_b:
+            res.append(h)
     # Keep unique while preserving order
     seen = set()
     uniq = []
@@ -321,77 +490,288 @@ def pick_metrics(headers_a: List[str], headers_b: List[str], requested: Optional
 
 # ---------- Comparison ----------
 
-def compare(old_rows, new_rows, key_cols, metrics, time_unit, mem_unit,
-            warn_time, warn_alloc, warn_throughput, fail_on_regression, out_path):
-    # Index by key
-    old_map = { build_key(r, key_cols): r for r in old_rows }
-    new_map = { build_key(r, key_cols): r for r in new_rows }
-    keys = sorted(set(old_map.keys()) | set(new_map.keys()))
+CSV_FIELDS = ("key", "status", "metric", "old", "new", "delta_pct", "delta_sign", "better_direction")
+
+class CmpRow(NamedTuple):
+    """One long-form comparison record, in CSV_FIELDS order. A tuple is
+    ~3x smaller than the dict-per-row it replaces and cheaper to build."""
+    key: str
+    status: str
+    metric: str
+    old: str
+    new: str
+    delta_pct: str
+    delta_sign: str
+    better: str
+
+# Only fan out to worker processes when there are enough keys to amortize
+# process start-up and argument pickling.
+PAR_THRESHOLD = 2048
+
+def _compare_chunk(keys_chunk, old_map, new_map, old_cols, new_cols, key_cols,
+                   metric_specs, widths,
+                   warn_time, warn_alloc, warn_throughput):
+    """Scalar comparison of one slice of keys.
+
+    Returns (console_lines, csv_rows, regressions). Module-level and
+    self-contained so ProcessPoolExecutor can pickle it; also serves as the
+    sequential fallback body when numpy/pandas are missing.
+    """
+    lines = []
+    rows_out = []
+    regressions = []
+    _cell = cell
+    _convert = convert_to_base
+    out_append = rows_out.append
+    for k in keys_chunk:
+        oi = old_map.get(k)
+        ni = new_map.get(k)
+        has_old = oi is not None
+        has_new = ni is not None
+        status = "changed" if has_old and has_new else ("added" if has_new else "removed")
+        kdisp = key_to_display(k, key_cols)
+        row_cells = [kdisp, status]
+        for m, kind, scale, suf, better in metric_specs:
+            old_base = _convert(m, _cell(old_cols, m, oi)) if has_old else None
+            new_base = _convert(m, _cell(new_cols, m, ni)) if has_new else None
+
+            old_disp = "-" if old_base is None else (f"{old_base / scale:.3f} {suf}" if suf else f"{old_base / scale:.3f}")
+            new_disp = "-" if new_base is None else (f"{new_base / scale:.3f} {suf}" if suf else f"{new_base / scale:.3f}")
+
+            delta = None
+            is_regression = False
+            if has_old and has_new:
+                if old_base is not None and old_base != 0:
+                    delta = (new_base - old_base) / old_base * 100.0
+                    if kind in ("time", "gc"):
+                        is_regression = delta > warn_time
+                    elif kind == "memory":
+                        is_regression = delta > warn_alloc
+                    elif kind == "throughput":
+                        is_regression = delta < -warn_throughput
+
+            cell_delta = f"{pct(delta)} {arrow(delta, m, kind)}" if delta is not None else "-"
+            row_cells.extend([old_disp, new_disp, cell_delta])
+
+            if is_regression:
+                regressions.append((kdisp, m, delta))
+
+            # CSV output row (long form)
+            out_append(CmpRow(
+                kdisp,
+                status,
+                m,
+                old_disp,
+                new_disp,
+                f"{delta:.4f}" if delta is not None else "",
+                "pos" if (delta or 0) > 0 else ("neg" if (delta or 0) < 0 else "zero"),
+                better,
+            ))
+
+        lines.append("  ".join(str(c).ljust(w) for c, w in zip(row_cells, widths)))
+    return lines, rows_out, regressions
+
+def build_compare_fn(metrics, kinds, time_unit, mem_unit, better_dir,
+                     old_base_cols, new_base_cols, deltas_by_metric):
+    """Generate a row-compare function specialized to this run's metric list.
+
+    Once --metrics is resolved, each metric's kind, display scale/suffix,
+    better-direction and delta arrays are constants for the whole run.
+    Rendering them into source and exec-ing it unrolls the metric loop into
+    straight-line code with no dict lookups or kind branches per cell.
+
+    The generated function takes (kdisp, status, oi, ni, j) where oi/ni are
+    row positions in the old/new column arrays (None if absent) and j is
+    the position in the aligned delta arrays (None if not in both files);
+    it returns (console_cells, csv_rows, regressions_for_row).
+    """
+    src = [
+        "def _compare_row(kdisp, status, oi, ni, j):",
+        "    cells = [kdisp, status]",
+        "    rows_out = []",
+        "    regs = []",
+    ]
+    g = {"CmpRow": CmpRow}
+    for i, m in enumerate(metrics):
+        kind = kinds[m]
+        scale, suffix, _ = make_fmt_spec(m, time_unit, mem_unit, kind)
+        val = "v" if scale == 1.0 else f"v / {scale!r}"
+        disp = f'f"{{{val}:.3f}} {suffix}"' if suffix else f'f"{{{val}:.3f}}"'
+        if kind in ("time", "memory", "gc"):
+            arrow_expr = '"\\u2193" if delta < 0 else ("\\u2191" if delta > 0 else "\\u2192")'
+        else:
+            arrow_expr = '"\\u2191" if delta > 0 else ("\\u2193" if delta < 0 else "\\u2192")'
+
+        g[f"ob_{i}"] = old_base_cols.get(m)
+        g[f"nb_{i}"] = new_base_cols.get(m)
+        pair = deltas_by_metric.get(m)
+        g[f"dl_{i}"], g[f"rg_{i}"] = pair if pair is not None else (None, None)
+
+        # Header text is untrusted; collapse whitespace so a newline in a
+        # quoted CSV header cannot split the comment and break the compile.
+        src.append(f"    # {' '.join(m.split())} ({kind})")
+        if g[f"ob_{i}"] is None:
+            src.append('    old_disp = "-"')
+        else:
+            src.extend([
+                "    if oi is None:",
+                '        old_disp = "-"',
+                "    else:",
+                f"        v = ob_{i}[oi]",
+                f'        old_disp = "-" if v != v else {disp}',
+            ])
+        if g[f"nb_{i}"] is None:
+            src.append('    new_disp = "-"')
+        else:
+            src.extend([
+                "    if ni is None:",
+                '        new_disp = "-"',
+                "    else:",
+                f"        v = nb_{i}[ni]",
+                f'        new_disp = "-" if v != v else {disp}',
+            ])
+        src.append("    delta = None")
+        if pair is not None:
+            src.extend([
+                "    if j is not None:",
+                f"        d = dl_{i}[j]",
+                "        if d == d:",
+                "            delta = float(d)",
+                f"            if rg_{i}[j]:",
+                f"                regs.append(({m!r}, delta))",
+            ])
+        src.extend([
+            "    if delta is None:",
+            '        cells.extend((old_disp, new_disp, "-"))',
+            f'        rows_out.append(CmpRow(kdisp, status, {m!r}, old_disp, new_disp, "", "zero", {better_dir[m]!r}))',
+            "    else:",
+            '        sign = "+" if delta > 0 else ""',
+            f"        arr = {arrow_expr}",
+            '        cells.extend((old_disp, new_disp, f"{sign}{delta:.2f}% {arr}"))',
+            f'        rows_out.append(CmpRow(kdisp, status, {m!r}, old_disp, new_disp, f"{{delta:.4f}}",',
+            '                         "pos" if delta > 0 else ("neg" if delta < 0 else "zero"),',
+            f"                         {better_dir[m]!r}))",
+        ])
+    src.append("    return cells, rows_out, regs")
+    exec(compile("\n".join(src), "<compare-gen>", "exec"), g)
+    return g["_compare_row"]
+
+def compare(old_cols, old_n, new_cols, new_n, key_cols, metrics, time_unit, mem_unit,
+            warn_time, warn_alloc, warn_throughput, fail_on_regression, out_path,
+            sort_keys=False, jobs=1):
+    # Index by key -> row position in the column arrays
+    old_map = { k: i for i, k in enumerate(build_keys(old_cols, old_n, key_cols)) }
+    new_map = { k: i for i, k in enumerate(build_keys(new_cols, new_n, key_cols)) }
+    if sort_keys:
+        # Sort by display string: tuple elements may mix types across files.
+        keys = sorted(set(old_map.keys()) | set(new_map.keys()),
+                      key=lambda t: key_to_display(t, key_cols))
+    else:
+        # Stable merge without the N log N sort: old-file order, then any
+        # new-only keys appended in new-file order.
+        keys = list(old_map)
+        keys.extend(k for k in new_map if k not in old_map)
+
+    # Classify metrics once; the inner loop previously re-ran the string-heavy
+    # classifier three times per (row, metric) cell.
+    kinds = build_metric_kind_map(metrics)
+    better_dir = {m: ("down" if kinds[m] in ("time", "memory", "gc") else "up") for m in metrics}
+
+    # Convert each metric column to base units up front (one vectorized pass
+    # per column) instead of re-parsing every cell inside the row loop.
+    old_base_cols = new_base_cols = None
+    if pd is not None:
+        old_base_cols = {m: convert_column_to_base(m, old_cols[m]) for m in metrics if m in old_cols}
+        new_base_cols = {m: convert_column_to_base(m, new_cols[m]) for m in metrics if m in new_cols}
+
+    # For keys present in both files, run the delta/threshold check as one
+    # numeric kernel per metric over aligned arrays instead of per row.
+    deltas_by_metric = None
+    both_pos = None
+    if old_base_cols is not None and np is not None:
+        both_pos, oidx, nidx = align_keys(keys, old_map, new_map)
+        deltas_by_metric = {}
+        for m in metrics:
+            oarr = old_base_cols.get(m)
+            narr = new_base_cols.get(m)
+            if oarr is None or narr is None:
+                continue
+            deltas = np.empty(len(oidx), dtype=np.float32)
+            regressed = np.empty(len(oidx), dtype=np.bool_)
+            # FP32 is plenty for percent deltas reported to 2-4 decimals and
+            # halves the memory bandwidth through the kernel; the display
+            # columns stay FP64 so formatted values are unaffected.
+            _delta_kernel(oarr[oidx].astype(np.float32), narr[nidx].astype(np.float32),
+                          KIND_CODES[kinds[m]],
+                          warn_time, warn_alloc, warn_throughput, deltas, regressed)
+            deltas_by_metric[m] = (deltas, regressed)
+
+    # Specialize the row loop for this run's fixed metric list; the scalar
+    # loop below remains as the fallback when numpy/pandas are missing.
+    row_fn = None
+    if deltas_by_metric is not None:
+        row_fn = build_compare_fn(metrics, kinds, time_unit, mem_unit, better_dir,
+                                  old_base_cols, new_base_cols, deltas_by_metric)
 
     # Prepare output
     out_csv_rows = []
     regressions = []
 
+    # (metric, kind, display scale, display suffix, better direction)
+    # hoisted out of the fallback loop
+    metric_specs = [(m, kinds[m]) + make_fmt_spec(m, time_unit, mem_unit, kinds[m])[:2]
+                    + (better_dir[m],) for m in metrics]
+
     # Header for console
     header_cells = ["Benchmark Key", "Status"]
     for m in metrics:
         header_cells.extend([f"{m} (old)", f"{m} (new)", f"{m} Δ"])
     widths = [max(16, len(h)) for h in header_cells]
 
-    def print_row(cells):
-        line = "  ".join(str(c).ljust(w) for c, w in zip(cells, widths))
-        print(line)
+    def format_row(cells):
+        return "  ".join(str(c).ljust(w) for c, w in zip(cells, widths))
 
-    print_row(header_cells)
+    # Header goes out immediately so users see progress start; row lines are
+    # buffered and flushed in one write instead of one print (and one stdio
+    # flush) per benchmark key.
+    print(format_row(header_cells))
     print("-" * (sum(widths) + 2 * (len(widths) - 1)))
-
-    for k in keys:
-        o = old_map.get(k)
-        n = new_map.get(k)
-        status = "changed" if o and n else ("added" if n and not o else "removed")
-        row_cells = [k, status]
-        for m in metrics:
-            old_raw = o.get(m, "") if o else ""
-            new_raw = n.get(m, "") if n else ""
-            old_base = convert_to_base(m, old_raw) if o else None
-            new_base = convert_to_base(m, new_raw) if n else None
-
-            old_disp = fmt_value(m, old_base, time_unit, mem_unit) if o else "-"
-            new_disp = fmt_value(m, new_base, time_unit, mem_unit) if n else "-"
-
-            delta = None
-            if o and n and old_base is not None and old_base != 0:
-                delta = (new_base - old_base) / old_base * 100.0
-
-            cell_delta = f"{pct(delta)} {arrow(delta if delta is not None else 0.0, m)}" if delta is not None else "-"
-            row_cells.extend([old_disp, new_disp, cell_delta])
-
-            # Regression detection
-            if delta is not None:
-                kind = metric_kind(m)
-                if kind in ("time", "gc"):
-                    if delta > warn_time:
-                        regressions.append((k, m, delta))
-                elif kind == "memory":
-                    if delta > warn_alloc:
-                        regressions.append((k, m, delta))
-                elif kind == "throughput":
-                    if delta < -warn_throughput:
-                        regressions.append((k, m, delta))
-
-            # CSV output row (long form)
-            out_csv_rows.append({
-                "key": k,
-                "status": status,
-                "metric": m,
-                "old": old_disp,
-                "new": new_disp,
-                "delta_pct": f"{delta:.4f}" if delta is not None else "",
-                "delta_sign": "pos" if (delta or 0) > 0 else ("neg" if (delta or 0) < 0 else "zero"),
-                "better_direction": "down" if metric_kind(m) in ("time","memory","gc") else "up"
-            })
-
-        print_row(row_cells)
+    out_lines = []
+
+    if row_fn is not None:
+        for k in keys:
+            oi = old_map.get(k)
+            ni = new_map.get(k)
+            status = "changed" if oi is not None and ni is not None else ("added" if ni is not None else "removed")
+            kdisp = key_to_display(k, key_cols)
+            row_cells, rows_out, regs = row_fn(kdisp, status, oi, ni, both_pos.get(k))
+            out_csv_rows.extend(rows_out)
+            for rm, rd in regs:
+                regressions.append((kdisp, rm, rd))
+            out_lines.append(format_row(row_cells))
+    else:
+        # Scalar fallback: the row comparison is embarrassingly parallel, so
+        # with --jobs split the key list into slices across worker processes.
+        worker = partial(_compare_chunk, old_map=old_map, new_map=new_map,
+                         old_cols=old_cols, new_cols=new_cols, key_cols=key_cols,
+                         metric_specs=metric_specs, widths=widths,
+                         warn_time=warn_time, warn_alloc=warn_alloc,
+                         warn_throughput=warn_throughput)
+        if jobs > 1 and len(keys) > PAR_THRESHOLD:
+            step = -(-len(keys) // jobs)
+            slices = [keys[i:i + step] for i in range(0, len(keys), step)]
+            with ProcessPoolExecutor(max_workers=jobs) as ex:
+                results = list(ex.map(worker, slices))
+        else:
+            results = [worker(keys)]
+        for lines, rows_out, regs in results:
+            out_lines.extend(lines)
+            out_csv_rows.extend(rows_out)
+            regressions.extend(regs)
+
+    if out_lines:
+        sys.stdout.write("\n".join(out_lines))
+        sys.stdout.write("\n")
 
     # Summary
     if regressions:
@@ -404,10 +784,9 @@ def compare(old_rows, new_rows, key_cols, metrics, time_unit, mem_unit,
     # Write optional CSV
     if out_path:
         with open(out_path, "w", newline="", encoding="utf-8") as f:
-            w = csv.DictWriter(f, fieldnames=["key","status","metric","old","new","delta_pct","delta_sign","better_direction"])
-            w.writeheader()
-            for r in out_csv_rows:
-                w.writerow(r)
+            w = csv.writer(f)
+            w.writerow(CSV_FIELDS)
+            w.writerows(out_csv_rows)
         print(f"\nWrote detailed comparison to: {out_path}")
 
     # Exit status
@@ -428,10 +807,13 @@ def main():
     ap.add_argument("--warn-throughput", type=float, default=5.0, help="Warn if throughput decreases by more than this percent (default: 5)")
     ap.add_argument("--fail-on-regression", action="store_true", help="Exit with code 2 if regressions detected")
     ap.add_argument("--out", help="Write a long-form comparison CSV to this path")
+    ap.add_argument("--legacy-csv", action="store_true", help="Force the stdlib csv reader instead of pyarrow")
+    ap.add_argument("--sort-keys", action="store_true", help="Sort benchmark keys alphabetically (default: old-file order, new-only keys appended)")
+    ap.add_argument("--jobs", type=int, default=1, help="Worker processes for the non-vectorized comparison path (default: 1)")
     args = ap.parse_args()
 
-    old_rows, old_headers = read_csv(args.old_csv)
-    new_rows, new_headers = read_csv(args.new_csv)
+    old_cols, old_headers, old_n = read_csv(args.old_csv, legacy=args.legacy_csv)
+    new_cols, new_headers, new_n = read_csv(args.new_csv, legacy=args.legacy_csv)
 
     user_keys = [c.strip() for c in args.key.split(",")] if args.key else None
     key_cols = pick_key_columns(old_headers, new_headers, user_keys)
@@ -448,8 +830,9 @@ def main():
 
     # Normalize mem unit
     mem_unit = args.mem_unit.upper()
-    compare(old_rows, new_rows, key_cols, metrics, args.time_unit, mem_unit,
-            args.warn_time, args.warn_alloc, args.warn_throughput, args.fail_on_regression, args.out)
+    compare(old_cols, old_n, new_cols, new_n, key_cols, metrics, args.time_unit, mem_unit,
+            args.warn_time, args.warn_alloc, args.warn_throughput, args.fail_on_regression, args.out,
+            sort_keys=args.sort_keys, jobs=args.jobs)
 
 if __name__ == "__main__":
     main()
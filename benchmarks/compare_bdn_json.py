@@ -1,15 +1,38 @@
 # tools/compare_bdn.py
-import json, sys
-from collections import defaultdict
+import sys
+
+try:
+    import orjson  # C-speed parser, ~3-5x faster than stdlib json
+except ImportError:
+    orjson = None
+try:
+    import ijson  # streaming parser; avoids building the whole DOM
+except ImportError:
+    ijson = None
+import json
 
 def load(path):
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
     with open(path) as f:
         return json.load(f)
 
-def map_results(bdn_json):
+def iter_benchmarks(path):
+    # Prefer orjson (fastest); stream with ijson when orjson is missing so
+    # large reports never need the full document in memory.
+    if orjson is None and ijson is not None:
+        with open(path, "rb") as f:
+            # use_float: ijson yields Decimal by default, which breaks the
+            # float arithmetic in the delta computations
+            yield from ijson.items(f, "Benchmarks.item", use_float=True)
+        return
+    yield from load(path)["Benchmarks"]
+
+def map_results(path):
     # Map: (typeName, method) -> { "mean": ns, "p95": ns, "alloc": bytes }
     m = {}
-    for r in bdn_json["Benchmarks"]:
+    for r in iter_benchmarks(path):
         k = (r["FullName"], r["MethodTitle"])
         stats = r["Statistics"]
         alloc = 0
@@ -28,8 +51,8 @@ if __name__ == "__main__":
     if len(sys.argv) != 3:
         print("Usage: python tools/compare_bdn.py <old.json> <new.json>")
         sys.exit(1)
-    old = map_results(load(sys.argv[1]))
-    new = map_results(load(sys.argv[2]))
+    old = map_results(sys.argv[1])
+    new = map_results(sys.argv[2])
 
     rows = []
     for k in sorted(set(old) | set(new)):